@@ -4,13 +4,24 @@ SME Matrix Multiplication Performance Visualization Script
 ARM Scalable Matrix Extension Optimization Analysis
 """
 
-import matplotlib.pyplot as plt
+# matplotlib and PIL are imported inside the plotting functions so that
+# load_data() and the panel specs can be reused without paying for them
+import io
 import numpy as np
+import os
+import sys
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 import warnings
 warnings.filterwarnings('ignore')
 
 def setup_plot_style():
-    plt.style.use('seaborn-v0_8-whitegrid')
+    import matplotlib
+    import matplotlib.style
+    from matplotlib.font_manager import FontProperties, findfont
+    
+    matplotlib.style.use('seaborn-v0_8-whitegrid')
     
     colors = {
         'cpu': '#7F7F7F',
@@ -22,7 +33,7 @@ def setup_plot_style():
         'baseline': '#7F7F7F',
     }
     
-    plt.rcParams.update({
+    matplotlib.rcParams.update({
         'font.family': 'serif',
         'font.serif': ['Times New Roman', 'DejaVu Serif'],
         'font.size': 14,
@@ -36,194 +47,324 @@ def setup_plot_style():
         'axes.edgecolor': colors['text'],
         'axes.spines.top': False,
         'axes.spines.right': False,
+        'svg.fonttype': 'none',
     })
     
-    return colors
-
-def load_data():
-    matrix_sizes = ['64×64×64', '128×128×128', '256×256×256']
-    
-    time_data = {
-        'cpu': [453.0, 2985.9, 11554.4],
-        'sme_cpu_prep': [39.4, 59.6, 140.2],
-        'sme_sme_prep': [5.1, 18.8, 66.1],
-        'sme_4tiles': [5.3, 8.4, 23.0],
-    }
-    
-    speedup_data = {
-        'cpu': [1.00, 1.00, 1.00],
-        'sme_cpu_prep': [11.50, 50.10, 82.41],
-        'sme_sme_prep': [88.82, 158.82, 174.80],
-        'sme_4tiles': [85.47, 355.46, 502.37],
+    # Resolve the serif family to font files once; text artists then skip findfont
+    fonts = {
+        weight: FontProperties(fname=findfont(FontProperties(family='serif', weight=weight)),
+                               weight=weight)
+        for weight in ('normal', 'bold')
     }
     
-    gflops_data = {
-        'cpu': [1.16, 1.40, 2.90],
-        'sme_cpu_prep': [13.31, 70.37, 239.33],
-        'sme_sme_prep': [102.80, 223.10, 507.63],
-        'sme_4tiles': [98.92, 499.32, 1458.89],
-    }
-    
-    return matrix_sizes, time_data, speedup_data, gflops_data
+    return colors, fonts
 
-def create_speedup_plot(ax, matrix_sizes, speedup_data, colors):
-    x = np.arange(len(matrix_sizes))
-    
-    methods = {
-        'sme_cpu_prep': ('SME (CPU Transpose + Single Tile)', 'o', colors['sme_cpu_prep']),
-        'sme_sme_prep': ('SME (SME Transpose + Single Tile)', 's', colors['sme_sme_prep']),
-        'sme_4tiles': ('SME (SME Transpose + 4-Tiles Parallel)', 'D', colors['sme_4tiles']),
-    }
-    
-    for key, (label, marker, color) in methods.items():
-        ax.plot(x, speedup_data[key], marker=marker, color=color, 
-               linewidth=3.0, markersize=10, markeredgewidth=2,
-               markeredgecolor='white', label=label, alpha=0.9, zorder=3)
-    
-    for i, val in enumerate(speedup_data['sme_4tiles']):
+MATRIX_SIZE_LABELS = ('64×64×64', '128×128×128', '256×256×256')
+X_TICKS = np.arange(len(MATRIX_SIZE_LABELS))
+XLIM = (-0.3, len(MATRIX_SIZE_LABELS) - 0.7)
+
+# x axis shared by every panel, applied as Axes properties when the axes are created
+AXES_TEMPLATE = dict(xticks=X_TICKS, xticklabels=MATRIX_SIZE_LABELS)
+
+METHODS = ('cpu', 'sme_cpu_prep', 'sme_sme_prep', 'sme_4tiles')
+CPU, SME_CPU_PREP, SME_SME_PREP, SME_4TILES = range(len(METHODS))
+
+TIME, SPEEDUP, GFLOPS = range(3)
+
+# float32 array indexed [metric, method, size]; metric order TIME/SPEEDUP/GFLOPS,
+# method order METHODS, size order MATRIX_SIZE_LABELS
+PERF_DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'perf.npy')
+
+@lru_cache(maxsize=1)
+def load_data():
+    # Read-only memmap, so the cached array can be shared between callers
+    return np.load(PERF_DATA, mmap_mode='r')
+
+BAR_WIDTH = 0.2
+
+ANNOTATION_BBOX = dict(boxstyle='round,pad=0.3', facecolor='white', alpha=0.8, linewidth=0.5)
+
+# series: (method index, legend label, marker for line panels / bar offset for bar panels)
+PanelSpec = namedtuple('PanelSpec',
+                       'kind series ylabel ylim yscale xlim title legend grid annotator')
+
+def annotate_speedup(ax, x, values, artists, colors, fonts):
+    bbox = dict(ANNOTATION_BBOX, edgecolor=colors['sme_4tiles'])
+    for i, val in enumerate(values[SME_4TILES]):
         y_offset = val * 1.10 if i != 1 else val * 1.15
         ax.text(x[i], y_offset, f'{val:.1f}×', ha='center', va='bottom',
-               fontsize=11, color=colors['sme_4tiles'], fontweight='bold',
-               bbox=dict(boxstyle='round,pad=0.3', facecolor='white', 
-                        alpha=0.8, edgecolor=colors['sme_4tiles'], linewidth=0.5))
+               fontsize=11, color=colors['sme_4tiles'], fontproperties=fonts['bold'], bbox=bbox)
     
     ax.axhline(y=1.0, color=colors['baseline'], linestyle='--', 
               linewidth=2.0, alpha=0.5, label='Baseline (CPU)', zorder=1)
-    
-    ax.set_ylabel('Speedup Factor (×)', fontweight='bold', color=colors['text'])
-    ax.set_ylim([0.5, 600])
-    ax.set_xlim([-0.3, len(matrix_sizes) - 0.7])
-    ax.set_xticks(x)
-    ax.set_xticklabels(matrix_sizes, fontsize=12)
-    ax.set_xlabel('Matrix Size (M×K×N)', fontweight='bold', color=colors['text'])
-    ax.set_title('Speedup Factor Analysis', fontweight='bold', pad=15, color=colors['text'])
-    ax.legend(loc='upper left', frameon=True, framealpha=0.95, fontsize=11,
-             fancybox=False, edgecolor=colors['grid'], ncol=1)
-    ax.grid(True, alpha=0.3, linestyle='--', zorder=0, color=colors['grid'])
-
-def create_throughput_plot(ax, matrix_sizes, gflops_data, colors):
-    x = np.arange(len(matrix_sizes))
-    bar_width = 0.2
-    
-    methods = [
-        ('cpu', 'CPU', colors['cpu'], -1.5),
-        ('sme_cpu_prep', 'CPU Prep\n+ Single', colors['sme_cpu_prep'], -0.5),
-        ('sme_sme_prep', 'SME Prep\n+ Single', colors['sme_sme_prep'], 0.5),
-        ('sme_4tiles', 'SME Prep\n+ 4-Tiles', colors['sme_4tiles'], 1.5),
-    ]
-    
-    for key, label, color, offset in methods:
-        values = gflops_data[key]
-        bars = ax.bar(x + offset * bar_width, values, bar_width,
-                     label=label, color=color, alpha=0.9, 
-                     edgecolor='white', linewidth=1.5)
-        
-        if key == 'sme_4tiles':
-            for i, (bar, val) in enumerate(zip(bars, values)):
-                if i % 2 == 1:
-                    height = bar.get_height()
-                    ax.text(bar.get_x() + bar.get_width()/2., height * 1.05,
-                           f'{val:.0f}', ha='center', va='bottom', fontsize=10,
-                           color=color, fontweight='bold')
-    
-    ax.set_ylabel('Throughput (GFLOPS)', fontweight='bold', color=colors['text'])
-    ax.set_ylim([0, 1700])
-    ax.set_xticks(x)
-    ax.set_xticklabels(matrix_sizes, fontsize=12)
-    ax.set_xlabel('Matrix Size (M×K×N)', fontweight='bold', color=colors['text'])
-    ax.set_title('Throughput Performance Comparison', fontweight='bold', pad=15, color=colors['text'])
-    ax.legend(loc='upper left', frameon=True, framealpha=0.95, fontsize=10.5,
-             fancybox=False, edgecolor=colors['grid'], ncol=2)
-    ax.grid(True, alpha=0.3, linestyle='--', axis='y', color=colors['grid'])
-
-def create_execution_time_plot(ax, matrix_sizes, time_data, colors):
-    x = np.arange(len(matrix_sizes))
-    
-    methods = {
-        'cpu': ('CPU Baseline', 'o', colors['cpu']),
-        'sme_cpu_prep': ('CPU Prep + Single Tile', 's', colors['sme_cpu_prep']),
-        'sme_sme_prep': ('SME Prep + Single Tile', '^', colors['sme_sme_prep']),
-        'sme_4tiles': ('SME Prep + 4-Tiles Parallel', 'D', colors['sme_4tiles']),
-    }
-    
-    for key, (label, marker, color) in methods.items():
-        ax.plot(x, time_data[key], marker=marker, color=color, 
-               linewidth=3.0, markersize=10, markeredgewidth=2,
-               markeredgecolor='white', label=label, alpha=0.9, zorder=3)
-    
-    best_vals = time_data['sme_4tiles']
+
+def annotate_throughput(ax, x, values, artists, colors, fonts):
+    labels = [f'{val:.0f}' if i % 2 == 1 else '' for i, val in enumerate(values[SME_4TILES])]
+    ax.bar_label(artists[SME_4TILES], labels=labels, padding=5, fontsize=10,
+                color=colors['sme_4tiles'], fontproperties=fonts['bold'])
+
+def annotate_execution_time(ax, x, values, artists, colors, fonts):
+    bbox = dict(ANNOTATION_BBOX, edgecolor=colors['sme_4tiles'])
+    best_vals = values[SME_4TILES]
     for i in [0, -1]:
         y_offset = best_vals[i] * 0.6 if i == 0 else best_vals[i] * 1.5
         va = 'top' if i == 0 else 'bottom'
         ax.text(x[i], y_offset, f'{best_vals[i]:.1f}μs', ha='center', va=va,
-               fontsize=10, color=colors['sme_4tiles'], fontweight='bold',
-               bbox=dict(boxstyle='round,pad=0.3', facecolor='white', 
-                        alpha=0.8, edgecolor=colors['sme_4tiles'], linewidth=0.5))
-    
-    ax.set_ylabel('Execution Time (μs)', fontweight='bold', color=colors['text'])
-    ax.set_yscale('log')
-    ax.set_ylim([3, 20000])
-    ax.set_xlim([-0.3, len(matrix_sizes) - 0.7])
-    ax.set_xticks(x)
-    ax.set_xticklabels(matrix_sizes, fontsize=12)
-    ax.set_xlabel('Matrix Size (M×K×N)', fontweight='bold', color=colors['text'])
-    ax.set_title('Execution Time Comparison (Log Scale)', fontweight='bold', pad=15, color=colors['text'])
-    ax.legend(loc='upper left', frameon=True, framealpha=0.95, fontsize=11,
-             fancybox=False, edgecolor=colors['grid'])
-    ax.grid(True, alpha=0.3, linestyle='--', which='both', color=colors['grid'])
+               fontsize=10, color=colors['sme_4tiles'], fontproperties=fonts['bold'], bbox=bbox)
 
-def main():
-    print("=" * 70)
-    print("SME Matrix Multiplication Performance Visualization")
-    print("=" * 70)
-    
-    colors = setup_plot_style()
-    matrix_sizes, time_data, speedup_data, gflops_data = load_data()
-    
-    fig = plt.figure(figsize=(18, 6))
+SPEEDUP_PANEL = PanelSpec(
+    kind='line',
+    series=(
+        (SME_CPU_PREP, 'SME (CPU Transpose + Single Tile)', 'o'),
+        (SME_SME_PREP, 'SME (SME Transpose + Single Tile)', 's'),
+        (SME_4TILES, 'SME (SME Transpose + 4-Tiles Parallel)', 'D'),
+    ),
+    ylabel='Speedup Factor (×)',
+    ylim=(0.5, 600),
+    yscale='linear',
+    xlim=XLIM,
+    title='Speedup Factor Analysis',
+    legend=dict(fontsize=11, ncol=1),
+    grid=dict(zorder=0),
+    annotator=annotate_speedup,
+)
+
+THROUGHPUT_PANEL = PanelSpec(
+    kind='bar',
+    series=(
+        (CPU, 'CPU', -1.5),
+        (SME_CPU_PREP, 'CPU Prep\n+ Single', -0.5),
+        (SME_SME_PREP, 'SME Prep\n+ Single', 0.5),
+        (SME_4TILES, 'SME Prep\n+ 4-Tiles', 1.5),
+    ),
+    ylabel='Throughput (GFLOPS)',
+    ylim=(0, 1700),
+    yscale='linear',
+    xlim=None,
+    title='Throughput Performance Comparison',
+    legend=dict(fontsize=10.5, ncol=2),
+    grid=dict(axis='y'),
+    annotator=annotate_throughput,
+)
+
+EXECUTION_TIME_PANEL = PanelSpec(
+    kind='line',
+    series=(
+        (CPU, 'CPU Baseline', 'o'),
+        (SME_CPU_PREP, 'CPU Prep + Single Tile', 's'),
+        (SME_SME_PREP, 'SME Prep + Single Tile', '^'),
+        (SME_4TILES, 'SME Prep + 4-Tiles Parallel', 'D'),
+    ),
+    ylabel='Execution Time (μs)',
+    ylim=(3, 20000),
+    yscale='log',
+    xlim=XLIM,
+    title='Execution Time Comparison (Log Scale)',
+    legend=dict(fontsize=11),
+    grid=dict(which='both'),
+    annotator=annotate_execution_time,
+)
+
+def plot_line_series(ax, x, values, series, colors):
+    # One LineCollection and one PathCollection per panel instead of a Line2D per method;
+    # returns proxy Line2D handles for the legend
+    from matplotlib.collections import LineCollection
+    from matplotlib.lines import Line2D
+    from matplotlib.markers import MarkerStyle
+    
+    indices = [i for i, _, _ in series]
+    line_colors = [colors[METHODS[i]] for i in indices]
+    
+    segments = np.stack([np.column_stack((x, values[i])) for i in indices])
+    ax.add_collection(LineCollection(segments, colors=line_colors, linewidths=3.0,
+                                     capstyle='projecting', joinstyle='round',
+                                     alpha=0.9, zorder=3))
+    
+    markers = ax.scatter(np.tile(x, len(indices)), values[indices].ravel(),
+                        s=10 ** 2, c=np.repeat(line_colors, len(x)),
+                        edgecolors='white', linewidths=2, alpha=0.9, zorder=3)
+    marker_paths = []
+    for _, _, marker in series:
+        style = MarkerStyle(marker)
+        marker_paths += [style.get_path().transformed(style.get_transform())] * len(x)
+    markers.set_paths(marker_paths)
+    
+    return [Line2D([], [], marker=marker, color=colors[METHODS[i]], 
+                  linewidth=3.0, markersize=10, markeredgewidth=2,
+                  markeredgecolor='white', label=label, alpha=0.9)
+            for i, label, marker in series]
+
+SUPERSCRIPTS = str.maketrans('-0123456789', '⁻⁰¹²³⁴⁵⁶⁷⁸⁹')
+
+def format_decade(value, pos):
+    # Plain-text 10ⁿ: the default mathtext labels are written to SVG under the
+    # resolved font file's name rather than the configured serif family stack
+    return '10' + str(round(np.log10(value))).translate(SUPERSCRIPTS)
+
+def render_panel(ax, values, spec, colors, fonts):
+    import matplotlib
+    from matplotlib.ticker import FuncFormatter
+    
+    artists = {}
+    handles = []
+    if spec.kind == 'bar':
+        for i, label, offset in spec.series:
+            artists[i] = ax.bar(X_TICKS + offset * BAR_WIDTH, values[i], BAR_WIDTH,
+                               label=label, color=colors[METHODS[i]], alpha=0.9, 
+                               edgecolor='white', linewidth=1.5)
+    else:
+        handles = plot_line_series(ax, X_TICKS, values, spec.series, colors)
+    
+    spec.annotator(ax, X_TICKS, values, artists, colors, fonts)
+    
+    label_size = matplotlib.rcParams['axes.labelsize']
+    ax.set_ylabel(spec.ylabel, fontproperties=fonts['bold'], fontsize=label_size,
+                 color=colors['text'])
+    ax.set_yscale(spec.yscale)
+    if spec.yscale == 'log':
+        ax.yaxis.set_major_formatter(FuncFormatter(format_decade))
+    ax.set_ylim(spec.ylim)
+    if spec.xlim is not None:
+        ax.set_xlim(spec.xlim)
+    ax.set_xlabel('Matrix Size (M×K×N)', fontproperties=fonts['bold'], fontsize=label_size,
+                 color=colors['text'])
+    ax.set_title(spec.title, fontproperties=fonts['bold'],
+                fontsize=matplotlib.rcParams['axes.titlesize'], pad=15, color=colors['text'])
+    
+    legend = dict(spec.legend)
+    legend_font = fonts['normal'].copy()
+    legend_font.set_size(legend.pop('fontsize'))
+    handles += ax.get_legend_handles_labels()[0]
+    ax.legend(handles=handles, loc='upper left', frameon=True, framealpha=0.95, prop=legend_font,
+             fancybox=False, edgecolor=colors['grid'], **legend)
+    ax.grid(True, alpha=0.3, linestyle='--', color=colors['grid'], **spec.grid)
+
+RASTER_DPI = 600
+
+OUTPUT_FILES = (
+    ('sme_matmul_performance.png', 300, 'GitHub/Web display (300 DPI)'),
+    ('sme_matmul_performance.pdf', None, 'LaTeX/Papers (vector)'),
+    ('sme_matmul_performance.svg', None, 'Vector graphics (editable)'),
+    ('sme_matmul_performance_hires.png', 600, 'Publication quality (600 DPI)'),
+)
+RASTER_FILES = tuple(entry for entry in OUTPUT_FILES if entry[1] is not None)
+VECTOR_FILES = tuple(entry for entry in OUTPUT_FILES if entry[1] is None)
+
+# PNGs are downsampled from the RASTER_DPI render by an integer factor
+assert all(RASTER_DPI % dpi == 0 for _, dpi, _ in RASTER_FILES)
+
+def build_figure():
+    import matplotlib
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
     
-    ax1 = fig.add_subplot(1, 3, 1)
-    ax2 = fig.add_subplot(1, 3, 2)
-    ax3 = fig.add_subplot(1, 3, 3)
+    colors, fonts = setup_plot_style()
+    data = load_data()
     
-    print("\n📊 Generating performance visualizations...")
-    create_speedup_plot(ax1, matrix_sizes, speedup_data, colors)
-    print("  ✓ Speedup analysis chart created")
+    fig = Figure(figsize=(18, 6))
+    FigureCanvasAgg(fig)
     
-    create_throughput_plot(ax2, matrix_sizes, gflops_data, colors)
-    print("  ✓ GFLOPS comparison chart created")
+    ax1, ax2, ax3 = fig.subplots(1, 3, subplot_kw=AXES_TEMPLATE)
     
-    create_execution_time_plot(ax3, matrix_sizes, time_data, colors)
-    print("  ✓ Execution time chart created")
+    render_panel(ax1, data[SPEEDUP], SPEEDUP_PANEL, colors, fonts)
+    render_panel(ax2, data[GFLOPS], THROUGHPUT_PANEL, colors, fonts)
+    render_panel(ax3, data[TIME], EXECUTION_TIME_PANEL, colors, fonts)
     
     fig.suptitle('ARM SME Matrix Multiplication Performance Analysis', 
-                fontsize=20, fontweight='bold', y=1.00, color=colors['text'])
+                fontproperties=fonts['bold'], fontsize=20, y=1.00, color=colors['text'])
     
-    plt.tight_layout()
-    plt.subplots_adjust(top=0.90, bottom=0.12)
+    fig.tight_layout()
+    fig.subplots_adjust(top=0.90, bottom=0.12)
     
-    output_formats = {
-        'png': {'dpi': 300, 'desc': 'GitHub/Web display (300 DPI)'},
-        'pdf': {'dpi': None, 'desc': 'LaTeX/Papers (vector)'},
-        'svg': {'dpi': None, 'desc': 'Vector graphics (editable)'},
-    }
+    # Computed once here and handed to every save instead of bbox_inches='tight',
+    # which would walk the artist tree again on each savefig
+    bbox = fig.get_tightbbox(fig.canvas.get_renderer())
+    bbox = bbox.padded(matplotlib.rcParams['savefig.pad_inches'])
     
-    print("\n💾 Saving visualization files...")
-    print("-" * 70)
+    return fig, bbox
+
+def save_rasters(fig, bbox):
+    # Rasterize once at RASTER_DPI through savefig's bbox handling, so artists past
+    # the figure edge are kept, and derive every PNG from that buffer
+    from PIL import Image
     
-    for fmt, settings in output_formats.items():
-        filename = f'sme_matmul_performance.{fmt}'
-        plt.savefig(filename, dpi=settings['dpi'], 
-                   bbox_inches='tight', facecolor='white')
-        print(f'  ✓ {filename:35s} - {settings["desc"]}')
+    buf = io.BytesIO()
+    fig.savefig(buf, format='rgba', dpi=RASTER_DPI, bbox_inches=bbox, facecolor='white')
+    size = (int(bbox.width * RASTER_DPI), int(bbox.height * RASTER_DPI))
+    image = Image.frombuffer('RGBA', size, buf.getbuffer(), 'raw', 'RGBA', 0, 1)
     
-    plt.savefig('sme_matmul_performance_hires.png', dpi=600, 
-               bbox_inches='tight', facecolor='white')
-    print(f'  ✓ {"sme_matmul_performance_hires.png":35s} - Publication quality (600 DPI)')
+    for filename, file_dpi, _ in RASTER_FILES:
+        image.reduce(RASTER_DPI // file_dpi).save(filename, dpi=(file_dpi, file_dpi),
+                                                  compress_level=1, optimize=False)
     
-    print("\n" + "=" * 70)
-    print("✅ Visualization Complete!")
-    print("=" * 70)
+    return [filename for filename, _, _ in RASTER_FILES]
+
+def save_vector(fig, bbox, filename):
+    fig.savefig(filename, bbox_inches=bbox, facecolor='white')
+    return [filename]
+
+# Worker entry points: each process builds its own figure
+def build_and_save_rasters():
+    return save_rasters(*build_figure())
+
+def build_and_save_vector(filename):
+    return save_vector(*build_figure(), filename)
+
+def main():
+    built = completed = False
+    saved = set()
+    
+    # Written in a finally block so a failed run still reports what completed;
+    # buffered so logging never interleaves with the workers
+    try:
+        # Every worker rebuilds the figure, so only fan out when each job gets its own core
+        if (os.cpu_count() or 1) > len(VECTOR_FILES):
+            with ProcessPoolExecutor(max_workers=1 + len(VECTOR_FILES)) as pool:
+                futures = [pool.submit(build_and_save_rasters)]
+                futures += [pool.submit(build_and_save_vector, filename)
+                            for filename, _, _ in VECTOR_FILES]
+                for future in futures:
+                    if future.exception() is None:
+                        built = True
+                        saved.update(future.result())
+                for future in futures:
+                    future.result()
+        else:
+            fig, bbox = build_figure()
+            built = True
+            saved.update(save_rasters(fig, bbox))
+            for filename, _, _ in VECTOR_FILES:
+                saved.update(save_vector(fig, bbox, filename))
+        completed = True
+    finally:
+        log_lines = [
+            "=" * 70,
+            "SME Matrix Multiplication Performance Visualization",
+            "=" * 70,
+            "\n📊 Generating performance visualizations...",
+        ]
+        if built:
+            log_lines += [
+                "  ✓ Speedup analysis chart created",
+                "  ✓ GFLOPS comparison chart created",
+                "  ✓ Execution time chart created",
+            ]
+        log_lines += [
+            "\n💾 Saving visualization files...",
+            "-" * 70,
+        ]
+        log_lines += [f'  ✓ {filename:35s} - {desc}'
+                      for filename, _, desc in OUTPUT_FILES if filename in saved]
+        log_lines += [
+            "\n" + "=" * 70,
+            "✅ Visualization Complete!" if completed else "❌ Visualization Failed!",
+            "=" * 70,
+        ]
+        sys.stdout.write('\n'.join(log_lines) + '\n')
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # Pin the backend only when run as a script, so importing this module from a
+    # notebook or REPL leaves the session's backend alone
+    import matplotlib
+    matplotlib.use('Agg')
+    main()